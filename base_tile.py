@@ -291,8 +291,9 @@ class BaseTile(BaseTileCore):
             widget = QPushButton()
             widget.setText(comp_spec.get('text', 'Button'))
             if 'action' in comp_spec:
-                # Connect to tile action handler
-                widget.clicked.connect(lambda: self.handle_action(comp_spec['action']))
+                # Route every button through one slot; the action rides on the widget
+                widget.setProperty("action", comp_spec['action'])
+                widget.clicked.connect(self._on_component_clicked)
                 
         elif comp_type == ComponentType.CONTAINER.value:
             widget = QFrame()
@@ -362,6 +363,10 @@ class BaseTile(BaseTileCore):
             if child.widget():
                 child.widget().deleteLater()
                 
+    def _on_component_clicked(self):
+        """Dispatch a component button click to handle_action."""
+        self.handle_action(self.sender().property("action"))
+        
     def handle_action(self, action: str):
         """
         Handle actions triggered by design components.
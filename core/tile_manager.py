@@ -15,7 +15,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.constants import (
     EVENT_TILE_CREATED, EVENT_TILE_UPDATED, EVENT_TILE_DELETED,
     EVENT_TILE_MOVED, EVENT_TILE_RESIZED,
-    DEFAULT_TILE_WIDTH, DEFAULT_TILE_HEIGHT
+    DEFAULT_TILE_WIDTH, DEFAULT_TILE_HEIGHT,
+    MIN_TILE_WIDTH, MAX_TILE_WIDTH, MIN_TILE_HEIGHT, MAX_TILE_HEIGHT
 )
 from core.exceptions import TileError, ValidationError
 from core.events import get_event_bus
@@ -253,8 +254,6 @@ class TileManager:
             raise TileError(tile_id=tile_id, message="Tile not found")
             
         # Validate dimensions
-        from core.constants import MIN_TILE_WIDTH, MAX_TILE_WIDTH, MIN_TILE_HEIGHT, MAX_TILE_HEIGHT
-        
         if not (MIN_TILE_WIDTH <= width <= MAX_TILE_WIDTH):
             raise ValidationError(
                 field="width",
@@ -332,8 +331,6 @@ class TileManager:
                 )
                 
         # Validate dimensions
-        from core.constants import MIN_TILE_WIDTH, MAX_TILE_WIDTH, MIN_TILE_HEIGHT, MAX_TILE_HEIGHT
-        
         width = tile_data.get("width")
         height = tile_data.get("height")
         
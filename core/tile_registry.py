@@ -37,6 +37,9 @@ class TileRegistry:
     def __init__(self):
         """Initialize tile registry."""
         self._types: Dict[str, TileTypeInfo] = {}
+        # Types grouped by category (keys sorted), rebuilt lazily after
+        # registrations change
+        self._by_category: Optional[Dict[str, List[TileTypeInfo]]] = None
         self.logger = get_logger("tile_registry")
         
         # Register built-in types
@@ -120,6 +123,7 @@ class TileRegistry:
             )
             
         self._types[type_info.tile_type] = type_info
+        self._by_category = None
         self.logger.debug(f"Registered tile type: {type_info.tile_type}")
         
     def unregister_type(self, tile_type: str) -> None:
@@ -131,6 +135,7 @@ class TileRegistry:
         """
         if tile_type in self._types:
             del self._types[tile_type]
+            self._by_category = None
             self.logger.debug(f"Unregistered tile type: {tile_type}")
             
     def get_type_info(self, tile_type: str) -> Optional[TileTypeInfo]:
@@ -164,10 +169,7 @@ class TileRegistry:
         Returns:
             List of tile types in the category
         """
-        return [
-            info for info in self._types.values()
-            if info.category == category
-        ]
+        return list(self._get_by_category().get(category, ()))
         
     def get_categories(self) -> List[str]:
         """
@@ -176,8 +178,16 @@ class TileRegistry:
         Returns:
             List of category names
         """
-        categories = set(info.category for info in self._types.values())
-        return sorted(list(categories))
+        return list(self._get_by_category())
+        
+    def _get_by_category(self) -> Dict[str, List[TileTypeInfo]]:
+        """Return the cached category -> types mapping, building it if stale."""
+        if self._by_category is None:
+            grouped: Dict[str, List[TileTypeInfo]] = {}
+            for info in self._types.values():
+                grouped.setdefault(info.category, []).append(info)
+            self._by_category = {category: grouped[category] for category in sorted(grouped)}
+        return self._by_category
         
     def is_valid_type(self, tile_type: str) -> bool:
         """
@@ -211,13 +211,13 @@ class DisplayManager(QObject):
         if not display:
             return "Unknown display"
             
-        info = f"{display.display_name}\n"
-        info += f"Resolution: {display.resolution_string}\n"
-        info += f"Position: ({display.x}, {display.y})\n"
-        info += f"DPI: {display.dpi:.0f}\n"
-        info += f"Scale Factor: {display.device_pixel_ratio:.1f}x"
-        
-        return info
+        return "\n".join((
+            display.display_name,
+            f"Resolution: {display.resolution_string}",
+            f"Position: ({display.x}, {display.y})",
+            f"DPI: {display.dpi:.0f}",
+            f"Scale Factor: {display.device_pixel_ratio:.1f}x",
+        ))
 
 
 # Global instance
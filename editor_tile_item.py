@@ -5,6 +5,15 @@ from PySide6.QtGui import QPen, QColor, QBrush, QPainter, QFont, QFontMetrics
 from PySide6.QtCore import Qt, QRectF, Signal, QPointF
 
 
+def _first_line(text: str, limit: int) -> str:
+    """Return the first line of text, looking at no more than limit + 1 chars.
+
+    The extra char lets callers tell a line of exactly limit chars from a
+    longer one that needs truncating.
+    """
+    return text[:limit + 1].partition('\n')[0]
+
+
 class EditorTileItem(QGraphicsItem):
     """A custom, movable QGraphicsItem that handles its own drag logic."""
 
@@ -71,9 +80,9 @@ class EditorTileItem(QGraphicsItem):
         """Extract and cache the display text from tile content."""
         content = self.tile_definition_data.get('content', '')
         # Get first line or "Empty Note"
-        first_line = content.split('\n')[0] if content else "Empty Note"
-        # Truncate if too long
         max_chars = 30
+        first_line = _first_line(content, max_chars) if content else "Empty Note"
+        # Truncate if too long
         if len(first_line) > max_chars:
             return first_line[:max_chars-3] + "..."
         return first_line
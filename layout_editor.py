@@ -6,7 +6,12 @@
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox,
                               QLabel, QPushButton, QListWidget, QListWidgetItem)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
+
+from widget_utils import fill_list_widget
+
+# Item data role holding tile and tile instance ids
+_USER_ROLE = Qt.ItemDataRole.UserRole
 
 
 class MinimalLayoutEditor(QWidget):
@@ -49,6 +54,7 @@ class MinimalLayoutEditor(QWidget):
         available_panel = QVBoxLayout()
         available_panel.addWidget(QLabel("Available Tiles:"))
         self.available_list = QListWidget()
+        self.available_list.setUniformItemSizes(True)
         available_panel.addWidget(self.available_list)
         
         # Add button
@@ -60,6 +66,7 @@ class MinimalLayoutEditor(QWidget):
         layout_panel = QVBoxLayout()
         layout_panel.addWidget(QLabel("Tiles in Layout:"))
         self.layout_list = QListWidget()
+        self.layout_list.setUniformItemSizes(True)
         layout_panel.addWidget(self.layout_list)
         
         # Remove button
@@ -78,46 +85,50 @@ class MinimalLayoutEditor(QWidget):
         
     def load_data(self):
         """Load displays and tiles."""
-        # Load displays
-        self.display_combo.clear()
+        # Load displays; filling the combo is not a user display change, so
+        # keep it from writing the layout back through on_display_changed
         displays = self.manager.display_manager.get_all_displays()
-        for i, display in enumerate(displays):
-            self.display_combo.addItem(f"Display {i}: {display['width']}x{display['height']}")
-            
-        # Set current display
         target_display = self.layout_data.get("display_settings", {}).get("target_display", 0)
-        self.display_combo.setCurrentIndex(target_display)
+        with QSignalBlocker(self.display_combo):
+            self.display_combo.clear()
+            self.display_combo.addItems([
+                f"Display {i}: {display['width']}x{display['height']}"
+                for i, display in enumerate(displays)
+            ])
+            self.display_combo.setCurrentIndex(target_display)
         
         # Load tiles
         self.load_tiles()
         
     def load_tiles(self):
         """Load available and layout tiles."""
-        # Clear lists
-        self.available_list.clear()
-        self.layout_list.clear()
-        
         # Get all tiles
         all_tiles = self.manager.storage.load_data().get("tiles", [])
         
         # Get tiles in this layout
         layout_tiles = self.layout_data.get("tile_instances", [])
-        layout_tile_ids = [t.get("tile_id") for t in layout_tiles]
+        layout_tile_ids = {t.get("tile_id") for t in layout_tiles}
+        tiles_by_id = {t['id']: t for t in all_tiles}
         
-        # Populate lists
+        # Build items, then populate each list in one batch
+        available_items = []
         for tile in all_tiles:
+            if tile['id'] in layout_tile_ids:
+                continue
             item = QListWidgetItem(f"{tile.get('name', 'Unnamed')} ({tile.get('tile_type', 'unknown')})")
-            item.setData(Qt.UserRole, tile['id'])
-            
-            if tile['id'] not in layout_tile_ids:
-                self.available_list.addItem(item)
+            item.setData(_USER_ROLE, tile['id'])
+            available_items.append(item)
                 
+        layout_items = []
         for instance in layout_tiles:
-            tile = next((t for t in all_tiles if t['id'] == instance['tile_id']), None)
+            tile = tiles_by_id.get(instance['tile_id'])
             if tile:
                 item = QListWidgetItem(f"{tile.get('name', 'Unnamed')} at ({instance['x']}, {instance['y']})")
-                item.setData(Qt.UserRole, instance['instance_id'])
-                self.layout_list.addItem(item)
+                item.setData(_USER_ROLE, instance['instance_id'])
+                layout_items.append(item)
+                
+        fill_list_widget(self.available_list, available_items)
+        fill_list_widget(self.layout_list, layout_items)
                 
     def on_display_changed(self, index):
         """Handle display change."""
@@ -128,7 +139,7 @@ class MinimalLayoutEditor(QWidget):
         """Add selected tile to layout."""
         current = self.available_list.currentItem()
         if current:
-            tile_id = current.data(Qt.UserRole)
+            tile_id = current.data(_USER_ROLE)
             # Add at default position
             self.manager.add_tile_to_layout(self.layout_data['id'], tile_id, 100, 100)
             self.load_tiles()
@@ -138,7 +149,7 @@ class MinimalLayoutEditor(QWidget):
         """Remove selected tile from layout."""
         current = self.layout_list.currentItem()
         if current:
-            instance_id = current.data(Qt.UserRole)
+            instance_id = current.data(_USER_ROLE)
             self.manager.remove_tile_from_layout(self.layout_data['id'], instance_id)
             self.load_tiles()
             self.status_label.setText("Tile removed from layout")
@@ -0,0 +1,31 @@
+# pinpoint/layout_list_model.py
+
+from PySide6.QtCore import Qt
+
+from row_list_model import RowListModel
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+
+class LayoutListModel(RowListModel):
+    """A lightweight list model over layout definitions.
+
+    Rows are copies of the layout dicts, so a view realises only the rows
+    it paints and no per-row item objects are allocated.
+    """
+
+    def set_layouts(self, layouts: list):
+        """Replace all rows with copies of the given layout definitions."""
+        self.set_rows(layouts)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+
+        layout = self._rows[index.row()]
+        if role == _DISPLAY_ROLE:
+            return layout.get('name', 'Unnamed')
+        if role == _USER_ROLE:
+            return layout['id']
+        return None
@@ -5,8 +5,9 @@ Counts lines in code files and documentation files (.md).
 """
 
 import os
+import array
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import argparse
 import json
 
@@ -75,20 +76,39 @@ SKIP_DIRS = {
     'egg-info',
 }
 
+# Generated lockfiles that match a counted extension but aren't worth reading
+SKIP_FILES = frozenset({
+    'package-lock.json',
+    'yarn.lock',
+    'pnpm-lock.yaml',
+    'Cargo.lock',
+    'poetry.lock',
+    'composer.lock',
+})
+
+# Files larger than this are skipped by default (bytes)
+DEFAULT_MAX_FILE_SIZE = 5 * 1024 * 1024
+
 
 class LineCounter:
     """Counts lines of code and documentation in a project."""
     
-    def __init__(self, root_path: Path):
+    def __init__(self, root_path: Path, max_file_size: Optional[int] = None,
+                 track_directories: bool = True):
         self.root_path = root_path
+        self.max_file_size = max_file_size
+        # Collecting directory paths can be turned off when they won't be exported
+        self.track_directories = track_directories
         self.stats = {
             'code': {},
             'docs': {},
             'total_code_lines': 0,
             'total_doc_lines': 0,
             'total_files': 0,
+            'skipped_large': 0,
             'files_by_type': {},
-            'directories': set(),
+            'directory_count': 0,
+            'directories': [],
         }
     
     def count_lines_in_file(self, file_path: Path) -> int:
@@ -107,58 +127,70 @@ class LineCounter:
     def scan_directory(self, directory: Path) -> None:
         """Recursively scan directory for code and doc files."""
         try:
-            for item in directory.iterdir():
-                if item.is_dir():
-                    if not self.should_skip_directory(item.name):
-                        self.stats['directories'].add(str(item.relative_to(self.root_path)))
-                        self.scan_directory(item)
-                elif item.is_file():
-                    self.process_file(item)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not self.should_skip_directory(entry.name):
+                            item = Path(entry.path)
+                            self.stats['directory_count'] += 1
+                            if self.track_directories:
+                                self.stats['directories'].append(str(item.relative_to(self.root_path)))
+                            self.scan_directory(item)
+                    elif entry.is_file():
+                        if entry.name in SKIP_FILES:
+                            continue
+                        self.process_file(Path(entry.path), entry)
         except PermissionError:
             print(f"Permission denied: {directory}")
     
-    def process_file(self, file_path: Path) -> None:
-        """Process a single file and update statistics."""
+    def process_file(self, file_path: Path, entry: Optional[os.DirEntry] = None) -> None:
+        """Process a single file and update statistics.
+        
+        entry, when given, is the scandir entry for file_path; its cached
+        stat is used for the size check.
+        """
         ext = file_path.suffix.lower()
-        rel_path = file_path.relative_to(self.root_path)
         
-        # Check if it's a code file
+        # Check if it's a code file, then a doc file
         if ext in CODE_EXTENSIONS:
-            lines = self.count_lines_in_file(file_path)
-            file_type = CODE_EXTENSIONS[ext]
-            
-            if file_type not in self.stats['code']:
-                self.stats['code'][file_type] = {'files': 0, 'lines': 0, 'file_list': []}
-            
-            self.stats['code'][file_type]['files'] += 1
-            self.stats['code'][file_type]['lines'] += lines
-            self.stats['code'][file_type]['file_list'].append((str(rel_path), lines))
-            self.stats['total_code_lines'] += lines
-            self.stats['total_files'] += 1
-            
-            # Track by extension
-            if ext not in self.stats['files_by_type']:
-                self.stats['files_by_type'][ext] = 0
-            self.stats['files_by_type'][ext] += 1
-        
-        # Check if it's a doc file
+            category, file_type, total_key = 'code', CODE_EXTENSIONS[ext], 'total_code_lines'
         elif ext in DOC_EXTENSIONS:
-            lines = self.count_lines_in_file(file_path)
-            file_type = DOC_EXTENSIONS[ext]
-            
-            if file_type not in self.stats['docs']:
-                self.stats['docs'][file_type] = {'files': 0, 'lines': 0, 'file_list': []}
-            
-            self.stats['docs'][file_type]['files'] += 1
-            self.stats['docs'][file_type]['lines'] += lines
-            self.stats['docs'][file_type]['file_list'].append((str(rel_path), lines))
-            self.stats['total_doc_lines'] += lines
-            self.stats['total_files'] += 1
-            
-            # Track by extension
-            if ext not in self.stats['files_by_type']:
-                self.stats['files_by_type'][ext] = 0
-            self.stats['files_by_type'][ext] += 1
+            category, file_type, total_key = 'docs', DOC_EXTENSIONS[ext], 'total_doc_lines'
+        else:
+            return
+        
+        # Only files we would count are stat'ed and checked against the cap
+        if self.max_file_size:
+            size = entry.stat().st_size if entry is not None else file_path.stat().st_size
+            if size > self.max_file_size:
+                self.stats['skipped_large'] += 1
+                return
+        
+        lines = self.count_lines_in_file(file_path)
+        rel_path = file_path.relative_to(self.root_path)
+        self._bump(category, file_type, total_key, ext, str(rel_path), lines)
+    
+    def _bump(self, category: str, file_type: str, total_key: str,
+              ext: str, rel_path: str, lines: int) -> None:
+        """Add one counted file to its category bucket and the totals."""
+        buckets = self.stats[category]
+        bucket = buckets.get(file_type)
+        if bucket is None:
+            bucket = buckets[file_type] = {
+                'files': 0, 'lines': 0,
+                'file_paths': [], 'file_lines': array.array('q'),
+            }
+        
+        bucket['files'] += 1
+        bucket['lines'] += lines
+        bucket['file_paths'].append(rel_path)
+        bucket['file_lines'].append(lines)
+        self.stats[total_key] += lines
+        self.stats['total_files'] += 1
+        
+        # Track by extension
+        files_by_type = self.stats['files_by_type']
+        files_by_type[ext] = files_by_type.get(ext, 0) + 1
     
     def run(self) -> Dict:
         """Run the line counter and return statistics."""
@@ -178,8 +210,7 @@ class LineCounter:
         for file_type, data in sorted(self.stats['code'].items()):
             print(f"{file_type:15} {data['files']:5} files   {data['lines']:7,} lines")
             if show_files:
-                for file_path, lines in sorted(data['file_list']):
-                    print(f"  - {file_path:50} {lines:6,} lines")
+                self._print_file_list(data)
         
         # Documentation files summary
         print("\nDOCUMENTATION FILES:")
@@ -187,8 +218,7 @@ class LineCounter:
         for file_type, data in sorted(self.stats['docs'].items()):
             print(f"{file_type:15} {data['files']:5} files   {data['lines']:7,} lines")
             if show_files:
-                for file_path, lines in sorted(data['file_list']):
-                    print(f"  - {file_path:50} {lines:6,} lines")
+                self._print_file_list(data)
         
         # Summary
         print("\n" + "="*60)
@@ -198,7 +228,8 @@ class LineCounter:
         print(f"Total code lines:     {self.stats['total_code_lines']:,}")
         print(f"Total doc lines:      {self.stats['total_doc_lines']:,}")
         print(f"Total lines:          {self.stats['total_code_lines'] + self.stats['total_doc_lines']:,}")
-        print(f"Directories scanned:  {len(self.stats['directories'])}")
+        print(f"Directories scanned:  {self.stats['directory_count']}")
+        print(f"Skipped large files:  {self.stats['skipped_large']:,}")
         
         # File type distribution
         print("\nFILE TYPE DISTRIBUTION:")
@@ -208,11 +239,27 @@ class LineCounter:
         
         print("="*60)
     
+    def _print_file_list(self, data: Dict) -> None:
+        """Print per-file line counts of a bucket, sorted by path."""
+        paths = data['file_paths']
+        lines = data['file_lines']
+        for i in sorted(range(len(paths)), key=paths.__getitem__):
+            print(f"  - {paths[i]:50} {lines[i]:6,} lines")
+    
     def export_json(self, output_path: Path) -> None:
         """Export statistics to JSON file."""
-        # Convert sets to lists for JSON serialization
         export_data = self.stats.copy()
-        export_data['directories'] = sorted(list(export_data['directories']))
+        export_data['directories'] = sorted(export_data['directories'])
+        # Rebuild the exported [path, lines] pairs from the parallel arrays
+        for category in ('code', 'docs'):
+            export_data[category] = {
+                file_type: {
+                    'files': data['files'],
+                    'lines': data['lines'],
+                    'file_list': [list(pair) for pair in zip(data['file_paths'], data['file_lines'])],
+                }
+                for file_type, data in export_data[category].items()
+            }
         
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(export_data, f, indent=2)
@@ -248,6 +295,12 @@ def main():
         action='store_true',
         help='Include hidden directories (starting with .)'
     )
+    parser.add_argument(
+        '--max-file-size',
+        type=int,
+        default=DEFAULT_MAX_FILE_SIZE,
+        help='Skip files larger than this many bytes (default: 5 MiB, 0 to disable)'
+    )
     
     args = parser.parse_args()
     
@@ -268,7 +321,11 @@ def main():
         return 1
     
     # Create and run counter
-    counter = LineCounter(scan_path)
+    counter = LineCounter(
+        scan_path,
+        max_file_size=args.max_file_size,
+        track_directories=bool(args.export)
+    )
     
     # Modify skip behavior if including hidden directories
     if args.include_hidden:
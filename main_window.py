@@ -4,9 +4,14 @@
 """Minimal main window for PinPoint - structural only."""
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                              QPushButton, QListWidget, QListWidgetItem, 
-                              QSplitter, QLabel)
-from PySide6.QtCore import Qt, Signal
+                              QPushButton, QListView, QSplitter, QLabel)
+from PySide6.QtCore import Qt, Signal, QTimer
+
+from layout_list_model import LayoutListModel
+from tile_list_model import TileListModel
+
+# Item data role holding layout and tile ids
+_USER_ROLE = Qt.ItemDataRole.UserRole
 
 
 class MinimalMainWindow(QMainWindow):
@@ -25,9 +30,25 @@ class MinimalMainWindow(QMainWindow):
         self.create_ui()
         self.load_data()
         
+        # Coalesce bursts of manager change signals into a single reload
+        self._layouts_dirty = False
+        self._tiles_dirty = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._flush_refresh)
+        
+        # Studio edits arrive per keystroke; keep only the latest per tile
+        self._pending_tile_updates = {}
+        self._tile_update_timer = QTimer(self)
+        self._tile_update_timer.setSingleShot(True)
+        self._tile_update_timer.setInterval(100)
+        self._tile_update_timer.timeout.connect(self._flush_tile_updates)
+        
         # Connect manager signals
-        self.manager.layouts_changed.connect(self.load_layouts)
-        self.manager.tiles_changed.connect(self.load_tiles)
+        self.manager.layouts_changed.connect(self._schedule_layouts_refresh)
+        self.manager.tiles_changed.connect(self._schedule_tiles_refresh)
+        self.manager.tile_updated_in_studio.connect(self.on_tile_data_changed)
         
     def create_ui(self):
         """Create minimal UI."""
@@ -42,8 +63,11 @@ class MinimalMainWindow(QMainWindow):
         
         # Layout list
         left_layout.addWidget(QLabel("Layouts:"))
-        self.layout_list = QListWidget()
-        self.layout_list.itemClicked.connect(self.on_layout_clicked)
+        self.layout_model = LayoutListModel(self)
+        self.layout_list = QListView()
+        self.layout_list.setModel(self.layout_model)
+        self.layout_list.setUniformItemSizes(True)
+        self.layout_list.clicked.connect(self.on_layout_clicked)
         left_layout.addWidget(self.layout_list)
         
         # Layout buttons
@@ -58,8 +82,14 @@ class MinimalMainWindow(QMainWindow):
         
         # Tile list
         left_layout.addWidget(QLabel("Tiles:"))
-        self.tile_list = QListWidget()
-        self.tile_list.itemClicked.connect(self.on_tile_clicked)
+        self.tile_model = TileListModel(self)
+        self.tile_list = QListView()
+        self.tile_list.setModel(self.tile_model)
+        # Rows share one height; lay them out in batches rather than all upfront
+        self.tile_list.setUniformItemSizes(True)
+        self.tile_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.tile_list.setBatchSize(100)
+        self.tile_list.clicked.connect(self.on_tile_clicked)
         left_layout.addWidget(self.tile_list)
         
         # Tile buttons
@@ -88,35 +118,74 @@ class MinimalMainWindow(QMainWindow):
         
     def load_data(self):
         """Load layouts and tiles."""
-        self.load_layouts()
-        self.load_tiles()
-        
-    def load_layouts(self):
-        """Load layout list."""
-        self.layout_list.clear()
-        layouts = self.manager.storage.load_data().get("layouts", [])
-        for layout in layouts:
-            item = QListWidgetItem(layout.get('name', 'Unnamed'))
-            item.setData(Qt.UserRole, layout['id'])
-            self.layout_list.addItem(item)
+        data = self.manager.storage.load_data()
+        self.load_layouts(data)
+        self.load_tiles(data)
+        
+    def _schedule_layouts_refresh(self):
+        """Mark the layout list stale and (re)start the refresh timer."""
+        self._layouts_dirty = True
+        # While hidden in the tray, showEvent does the reload instead
+        if self.isVisible():
+            self._refresh_timer.start()
+        
+    def _schedule_tiles_refresh(self):
+        """Mark the tile list stale and (re)start the refresh timer."""
+        self._tiles_dirty = True
+        if self.isVisible():
+            self._refresh_timer.start()
+        
+    def _flush_refresh(self):
+        """Reload whichever lists were marked stale since the last reload."""
+        if not (self._layouts_dirty or self._tiles_dirty):
+            return
+            
+        # One storage read serves both lists
+        data = self.manager.storage.load_data()
+        if self._layouts_dirty:
+            self._layouts_dirty = False
+            self.load_layouts(data)
+        if self._tiles_dirty:
+            self._tiles_dirty = False
+            # The reload carries the latest storage data; queued edits are older
+            self._pending_tile_updates.clear()
+            self._tile_update_timer.stop()
+            self.load_tiles(data)
             
-    def load_tiles(self):
-        """Load tile list."""
-        self.tile_list.clear()
-        tiles = self.manager.storage.load_data().get("tiles", [])
-        for tile in tiles:
-            item = QListWidgetItem(f"{tile.get('name', 'Unnamed')} ({tile.get('tile_type', 'unknown')})")
-            item.setData(Qt.UserRole, tile['id'])
-            self.tile_list.addItem(item)
+    def load_layouts(self, data=None):
+        """Load layout list, reading storage unless data is given."""
+        if data is None:
+            data = self.manager.storage.load_data()
+        layouts = data.get("layouts", [])
+        self.layout_model.set_layouts(layouts)
             
-    def on_layout_clicked(self, item):
+    def load_tiles(self, data=None):
+        """Load tile list, reading storage unless data is given."""
+        if data is None:
+            data = self.manager.storage.load_data()
+        tiles = data.get("tiles", [])
+        self.tile_model.set_tiles(tiles)
+            
+    def on_tile_data_changed(self, tile_data):
+        """Queue a row refresh for a tile edited in the studio."""
+        self._pending_tile_updates[tile_data.get('id')] = tile_data
+        if self.isVisible() and not self._tile_update_timer.isActive():
+            self._tile_update_timer.start()
+            
+    def _flush_tile_updates(self):
+        """Apply the latest queued data of each edited tile to its row."""
+        pending, self._pending_tile_updates = self._pending_tile_updates, {}
+        for tile_data in pending.values():
+            self.tile_model.update_tile(tile_data)
+            
+    def on_layout_clicked(self, index):
         """Handle layout selection."""
-        layout_id = item.data(Qt.UserRole)
+        layout_id = index.data(_USER_ROLE)
         self.layout_selected.emit(layout_id)
         
-    def on_tile_clicked(self, item):
+    def on_tile_clicked(self, index):
         """Handle tile selection."""
-        tile_id = item.data(Qt.UserRole)
+        tile_id = index.data(_USER_ROLE)
         self.tile_selected.emit(tile_id)
         
     def create_layout(self):
@@ -125,9 +194,9 @@ class MinimalMainWindow(QMainWindow):
         
     def delete_layout(self):
         """Delete selected layout."""
-        current = self.layout_list.currentItem()
-        if current:
-            layout_id = current.data(Qt.UserRole)
+        current = self.layout_list.currentIndex()
+        if current.isValid():
+            layout_id = current.data(_USER_ROLE)
             self.manager.delete_layout(layout_id)
             
     def create_tile(self):
@@ -137,11 +206,20 @@ class MinimalMainWindow(QMainWindow):
         
     def delete_tile(self):
         """Delete selected tile."""
-        current = self.tile_list.currentItem()
-        if current:
-            tile_id = current.data(Qt.UserRole)
+        current = self.tile_list.currentIndex()
+        if current.isValid():
+            tile_id = current.data(_USER_ROLE)
             self.manager.delete_tile(tile_id)
             
+    def showEvent(self, event):
+        """Apply changes that arrived while the window was hidden."""
+        super().showEvent(event)
+        # Queued edits first, so a pending reload's newer data wins
+        self._tile_update_timer.stop()
+        self._flush_tile_updates()
+        self._refresh_timer.stop()
+        self._flush_refresh()
+            
     def closeEvent(self, event):
         """Handle window close."""
         if self.manager.shutting_down:
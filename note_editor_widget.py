@@ -3,6 +3,9 @@
 from PySide6.QtWidgets import QWidget, QTextEdit, QVBoxLayout
 from PySide6.QtCore import QTimer
 
+# Shared by every note editor
+_TEXT_EDIT_STYLE = "QTextEdit { font-size: 14px; border: none; }"
+
 
 class NoteEditorWidget(QWidget):
     """A dedicated widget for editing a single text note."""
@@ -19,7 +22,7 @@ class NoteEditorWidget(QWidget):
         layout = QVBoxLayout(self)
         self.text_edit = QTextEdit()
         self.text_edit.setPlainText(tile_data['content'])
-        self.text_edit.setStyleSheet("QTextEdit { font-size: 14px; border: none; }")
+        self.text_edit.setStyleSheet(_TEXT_EDIT_STYLE)
         layout.addWidget(self.text_edit)
         
         # Debouncing setup
@@ -0,0 +1,58 @@
+# pinpoint/row_list_model.py
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex
+
+
+class RowListModel(QAbstractListModel):
+    """A list model over stored dicts that each carry a unique 'id'.
+
+    Rows are copies of the given dicts, so a caller that later mutates its
+    own dicts in place cannot hide a change from the next set_rows. Subclasses
+    provide data().
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._row_by_id = {}
+
+    def set_rows(self, rows: list):
+        """Replace all rows with copies of the given dicts.
+
+        When the ids are the same, in the same order, only the rows whose
+        data changed are refreshed, so the view keeps its selection and scroll.
+        """
+        if rows == self._rows:
+            return
+        if self._same_ids(rows):
+            self._update_rows(rows)
+            return
+
+        self.beginResetModel()
+        self._rows = [dict(row) for row in rows]
+        self._row_by_id = {row['id']: i for i, row in enumerate(self._rows)}
+        self.endResetModel()
+
+    def _same_ids(self, rows: list) -> bool:
+        """Return whether rows lists the same ids, in order, as the current rows."""
+        return (len(rows) == len(self._rows)
+                and all(new['id'] == old['id'] for new, old in zip(rows, self._rows)))
+
+    def _update_rows(self, rows: list):
+        """Swap in copies of changed rows and emit one dataChanged over them."""
+        current = self._rows
+        first = last = None
+        for i, row in enumerate(rows):
+            if row != current[i]:
+                current[i] = dict(row)
+                if first is None:
+                    first = i
+                last = i
+
+        if first is not None:
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
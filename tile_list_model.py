@@ -0,0 +1,46 @@
+# pinpoint/tile_list_model.py
+
+from PySide6.QtCore import Qt
+
+from row_list_model import RowListModel
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+
+class TileListModel(RowListModel):
+    """A lightweight list model over tile definitions.
+
+    Rows are copies of the tile dicts; display text is produced on demand,
+    so only the rows a view actually paints cost anything.
+    """
+
+    def set_tiles(self, tiles: list):
+        """Replace all rows with copies of the given tile definitions."""
+        self.set_rows(tiles)
+
+    def update_tile(self, tile_data: dict) -> bool:
+        """Refresh the single row for tile_data, if that tile is listed.
+
+        Returns:
+            True if the tile was found and its row updated
+        """
+        row = self._row_by_id.get(tile_data.get('id'))
+        if row is None:
+            return False
+
+        self._rows[row] = dict(tile_data)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+
+        tile = self._rows[index.row()]
+        if role == _DISPLAY_ROLE:
+            return f"{tile.get('name', 'Unnamed')} ({tile.get('tile_type', 'unknown')})"
+        if role == _USER_ROLE:
+            return tile['id']
+        return None
@@ -0,0 +1,23 @@
+# pinpoint/widget_utils.py
+
+from PySide6.QtCore import QSignalBlocker
+from PySide6.QtWidgets import QListWidget
+
+
+def fill_list_widget(list_widget: QListWidget, items) -> None:
+    """Replace the contents of a list widget with prepared items in one batch.
+
+    Repaints, signals and sorting are suspended while the items are inserted
+    so the view is laid out and painted once instead of once per item.
+    """
+    with QSignalBlocker(list_widget):
+        list_widget.setUpdatesEnabled(False)
+        sorting_enabled = list_widget.isSortingEnabled()
+        list_widget.setSortingEnabled(False)
+        try:
+            list_widget.clear()
+            for item in items:
+                list_widget.addItem(item)
+        finally:
+            list_widget.setSortingEnabled(sorting_enabled)
+            list_widget.setUpdatesEnabled(True)